@@ -1,3 +1,5 @@
+import concurrent.futures
+import contextlib
 from typing import Dict
 from dataclasses import dataclass
 
@@ -93,22 +95,26 @@ class JiantRunner:
             yield train_state
 
     def run_train_step(self, train_dataloader_dict: dict, train_state: TrainState):
-        self.jiant_model.train()
+        # .train() walks the whole module tree, so only call it after e.g. an eval switched modes
+        if not self.jiant_model.training:
+            self.jiant_model.train()
         task_name, task = self.jiant_task_container.task_sampler.pop()
         task_specific_config = self.jiant_task_container.task_specific_configs[task_name]
-
-        loss_val = 0
-        for i in range(task_specific_config.gradient_accumulation_steps):
-            batch, batch_metadata = train_dataloader_dict[task_name].pop()
-            batch = batch.to(self.device)
-            model_output = wrap_jiant_forward(
-                jiant_model=self.jiant_model, batch=batch, task=task, compute_loss=True,
-            )
-            loss = self.complex_backpropagate(
-                loss=model_output.loss,
-                gradient_accumulation_steps=task_specific_config.gradient_accumulation_steps,
-            )
-            loss_val += loss.item()
+        gradient_accumulation_steps = task_specific_config.gradient_accumulation_steps
+        train_dataloader = train_dataloader_dict[task_name]
+
+        loss_val = torch.zeros((), device=self.device)
+        for i in range(gradient_accumulation_steps):
+            batch, batch_metadata = train_dataloader.pop()
+            # Only all-reduce gradients on the last accumulation step
+            with self.maybe_no_sync(is_last_step=i == gradient_accumulation_steps - 1):
+                model_output = wrap_jiant_forward(
+                    jiant_model=self.jiant_model, batch=batch, task=task, compute_loss=True,
+                )
+                loss = self.complex_backpropagate(
+                    loss=model_output.loss, gradient_accumulation_steps=gradient_accumulation_steps,
+                )
+            loss_val += loss.detach()
 
         self.optimizer_scheduler.step()
         self.optimizer_scheduler.optimizer.zero_grad()
@@ -120,7 +126,7 @@ class JiantRunner:
                 "task": task_name,
                 "task_step": train_state.task_steps[task_name],
                 "global_step": train_state.global_steps,
-                "loss_val": loss_val / task_specific_config.gradient_accumulation_steps,
+                "loss_val": loss_val.item() / gradient_accumulation_steps,
             },
         )
 
@@ -170,10 +176,13 @@ class JiantRunner:
             train_batch_size = self.jiant_task_container.task_specific_configs[
                 task_name
             ].train_batch_size
-            train_dataloader_dict[task_name] = InfiniteYield(
-                get_train_dataloader_from_cache(
-                    train_cache=train_cache, task=task, train_batch_size=train_batch_size,
-                )
+            train_dataloader_dict[task_name] = torch_utils.CudaPrefetchYield(
+                InfiniteYield(
+                    get_train_dataloader_from_cache(
+                        train_cache=train_cache, task=task, train_batch_size=train_batch_size,
+                    )
+                ),
+                device=self.device,
             )
         return train_dataloader_dict
 
@@ -224,6 +233,14 @@ class JiantRunner:
             max_grad_norm=self.rparams.max_grad_norm,
         )
 
+    def maybe_no_sync(self, is_last_step):
+        if not is_last_step and isinstance(
+            self.jiant_model, torch.nn.parallel.DistributedDataParallel
+        ):
+            return self.jiant_model.no_sync()
+        else:
+            return contextlib.nullcontext()
+
     def get_runner_state(self):
         # TODO: Add fp16  (Issue #46)
         state = {
@@ -242,13 +259,30 @@ class CheckpointSaver:
         self.metadata = metadata
         self.save_path = save_path
 
+        # Checkpoints are written in a background thread, so that training is not blocked on I/O
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
     def save(self, runner_state: dict, metarunner_state: dict):
+        self.wait()
+        # Snapshot the state on the CPU first, since training will keep updating it in-place.
+        #   best_state_dict is already a CPU copy that eval_save replaces rather than updates,
+        #   so it is saved as-is instead of being copied again
         to_save = {
-            "runner_state": runner_state,
-            "metarunner_state": metarunner_state,
-            "metadata": self.metadata,
+            "runner_state": torch_utils.copy_to_cpu(runner_state),
+            "metarunner_state": {
+                k: v if k == "best_state_dict" else torch_utils.copy_to_cpu(v)
+                for k, v in metarunner_state.items()
+            },
+            "metadata": torch_utils.copy_to_cpu(self.metadata),
         }
-        torch_utils.safe_save(to_save, self.save_path)
+        self._pending = self._executor.submit(torch_utils.safe_save, to_save, self.save_path)
+
+    def wait(self):
+        """Block until the most recent checkpoint has been written (re-raising any errors)"""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
 
 
 def run_val(
@@ -267,33 +301,37 @@ def run_val(
     if not local_rank == -1:
         return
     jiant_model.eval()
-    total_eval_loss = 0
+    total_eval_loss = torch.zeros((), device=device)
     nb_eval_steps, nb_eval_examples = 0, 0
     evaluation_scheme = evaluate.get_evaluation_scheme_for_task(task=task)
     eval_accumulator = evaluation_scheme.get_accumulator()
 
+    pending_update = None
     for step, (batch, batch_metadata) in enumerate(
         maybe_tqdm(val_dataloader, desc=f"Eval ({task.name}, Val)", verbose=verbose)
     ):
-        batch = batch.to(device)
+        batch = batch.to(device, non_blocking=True)
 
         with torch.no_grad():
             model_output = wrap_jiant_forward(
                 jiant_model=jiant_model, batch=batch, task=task, compute_loss=True,
             )
-        batch_logits = model_output.logits.detach().cpu().numpy()
-        batch_loss = model_output.loss.mean().item()
+        batch_loss = model_output.loss.mean()
         total_eval_loss += batch_loss
-        eval_accumulator.update(
-            batch_logits=batch_logits,
-            batch_loss=batch_loss,
-            batch=batch,
-            batch_metadata=batch_metadata,
-        )
+        if pending_update is not None:
+            _update_accumulator(eval_accumulator=eval_accumulator, **pending_update)
+        pending_update = {
+            "batch_logits": torch_utils.AsyncToCpu(model_output.logits),
+            "batch_loss": torch_utils.AsyncToCpu(batch_loss),
+            "batch": batch,
+            "batch_metadata": batch_metadata,
+        }
 
         nb_eval_examples += len(batch)
         nb_eval_steps += 1
-    eval_loss = total_eval_loss / nb_eval_steps
+    if pending_update is not None:
+        _update_accumulator(eval_accumulator=eval_accumulator, **pending_update)
+    eval_loss = total_eval_loss.item() / nb_eval_steps
     tokenizer = (
         jiant_model.tokenizer
         if not torch_utils.is_data_parallel(jiant_model)
@@ -320,22 +358,42 @@ def run_test(test_dataloader, jiant_model: JiantModel, task, device, local_rank,
     evaluation_scheme = evaluate.get_evaluation_scheme_for_task(task=task)
     eval_accumulator = evaluation_scheme.get_accumulator()
 
+    pending_update = None
     for step, (batch, batch_metadata) in enumerate(
         maybe_tqdm(test_dataloader, desc=f"Eval ({task.name}, Test)", verbose=verbose)
     ):
-        batch = batch.to(device)
+        batch = batch.to(device, non_blocking=True)
 
         with torch.no_grad():
             model_output = wrap_jiant_forward(
                 jiant_model=jiant_model, batch=batch, task=task, compute_loss=False,
             )
-        batch_logits = model_output.logits.detach().cpu().numpy()
-        eval_accumulator.update(
-            batch_logits=batch_logits, batch_loss=0, batch=batch, batch_metadata=batch_metadata,
-        )
+        if pending_update is not None:
+            _update_accumulator(eval_accumulator=eval_accumulator, **pending_update)
+        pending_update = {
+            "batch_logits": torch_utils.AsyncToCpu(model_output.logits),
+            "batch_loss": 0,
+            "batch": batch,
+            "batch_metadata": batch_metadata,
+        }
+    if pending_update is not None:
+        _update_accumulator(eval_accumulator=eval_accumulator, **pending_update)
     return {
         "preds": evaluation_scheme.get_preds_from_accumulator(
             task=task, accumulator=eval_accumulator,
         ),
         "accumulator": eval_accumulator,
     }
+
+
+def _update_accumulator(eval_accumulator, batch_logits, batch_loss, batch, batch_metadata):
+    # Accumulator updates lag the forward pass by one step, so that the device-to-host copy of
+    #   the previous step's logits can complete while the current step is computing
+    if isinstance(batch_loss, torch_utils.AsyncToCpu):
+        batch_loss = batch_loss.item()
+    eval_accumulator.update(
+        batch_logits=batch_logits.numpy(),
+        batch_loss=batch_loss,
+        batch=batch,
+        batch_metadata=batch_metadata,
+    )
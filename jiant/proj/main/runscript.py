@@ -169,6 +169,7 @@ def run_loop(args: RunConfiguration, checkpoint=None):
                 metarunner.load_state(checkpoint["metarunner_state"])
                 del checkpoint["metarunner_state"]
             metarunner.run_train_loop()
+            checkpoint_saver.wait()
 
         if args.do_save:
             torch.save(
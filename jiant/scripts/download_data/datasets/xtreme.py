@@ -343,38 +343,22 @@ def download_tatoeba_data_and_write_config(task_data_base_path: str, task_config
     shutil.rmtree(tatoeba_temp_path)
 
 
+XTREME_DOWNLOAD_FUNCTION_DICT = {
+    "xnli": download_xnli_data_and_write_config,
+    "pawsx": download_pawsx_data_and_write_config,
+    "xquad": download_xquad_data_and_write_config,
+    "mlqa": download_mlqa_data_and_write_config,
+    "tydiqa": download_tydiqa_data_and_write_config,
+    "bucc2018": download_bucc2018_data_and_write_config,
+    "tatoeba": download_tatoeba_data_and_write_config,
+}
+
+
 def download_xtreme_data_and_write_config(
     task_name: str, task_data_base_path: str, task_config_base_path: str
 ):
-    if task_name == "xnli":
-        download_xnli_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "pawsx":
-        download_pawsx_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "xquad":
-        download_xquad_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "mlqa":
-        download_mlqa_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "tydiqa":
-        download_tydiqa_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "bucc2018":
-        download_bucc2018_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name == "tatoeba":
-        download_tatoeba_data_and_write_config(
-            task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
-        )
-    elif task_name in ["udpos", "panx"]:
+    if task_name in ["udpos", "panx"]:
         raise NotImplementedError(task_name)
-    else:
-        raise KeyError(task_name)
+    XTREME_DOWNLOAD_FUNCTION_DICT[task_name](
+        task_data_base_path=task_data_base_path, task_config_base_path=task_config_base_path,
+    )
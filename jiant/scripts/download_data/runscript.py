@@ -1,5 +1,6 @@
 import os
 import argparse
+import concurrent.futures
 
 import jiant.utils.python.io as py_io
 import jiant.scripts.download_data.datasets.nlp_tasks as nlp_tasks_download
@@ -8,7 +9,8 @@ import jiant.scripts.download_data.datasets.files_tasks as files_tasks_download
 from jiant.tasks.constants import GLUE_TASKS, SUPERGLUE_TASKS, XTREME_TASKS, BENCHMARKS
 
 NLP_DOWNLOADER_TASKS = GLUE_TASKS | SUPERGLUE_TASKS
-SUPPORTED_TASKS = NLP_DOWNLOADER_TASKS | XTREME_TASKS | {"squad_v1", "squad_v2"}
+SQUAD_TASKS = {"squad_v1", "squad_v2"}
+SUPPORTED_TASKS = NLP_DOWNLOADER_TASKS | XTREME_TASKS | SQUAD_TASKS
 
 
 # noinspection PyUnusedLocal
@@ -27,41 +29,66 @@ def download_data_cli(args):
     else:
         raise RuntimeError()
     download_data(
-        task_names=task_names, output_base_path=output_base_path,
+        task_names=task_names,
+        output_base_path=output_base_path,
+        max_parallel_downloads=args.max_parallel_downloads,
     )
 
 
-def download_data(task_names, output_base_path):
+def download_data(task_names, output_base_path, max_parallel_downloads=1):
     task_data_base_path = py_io.create_dir(output_base_path, "data")
     task_config_base_path = py_io.create_dir(output_base_path, "configs")
 
     assert set(task_names).issubset(SUPPORTED_TASKS)
 
     # Download specified tasks and generate configs for specified tasks
-    for i, task_name in enumerate(task_names):
-        task_data_path = os.path.join(task_data_base_path, task_name)
-
-        if task_name in NLP_DOWNLOADER_TASKS:
-            nlp_tasks_download.download_data_and_write_config(
-                task_name=task_name,
-                task_data_path=task_data_path,
-                task_config_path=os.path.join(task_config_base_path, f"{task_name}_config.json"),
-            )
-        elif task_name in XTREME_TASKS:
-            xtreme_download.download_xtreme_data_and_write_config(
+    #   Downloads are I/O bound, so tasks can be fetched concurrently in threads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_downloads) as executor:
+        future_to_task_name = {
+            executor.submit(
+                download_task_data_and_write_config,
                 task_name=task_name,
                 task_data_base_path=task_data_base_path,
                 task_config_base_path=task_config_base_path,
-            )
-        elif task_name in ["squad_v1", "squad_v2"]:
-            files_tasks_download.download_squad_data_and_write_config(
-                task_name=task_name,
-                task_data_path=task_data_path,
-                task_config_path=os.path.join(task_config_base_path, f"{task_name}.json"),
-            )
-        else:
-            raise KeyError()
-        print(f"Downloaded and generated configs for '{task_name}' ({i+1}/{len(task_names)})")
+            ): task_name
+            for task_name in task_names
+        }
+        try:
+            for i, future in enumerate(concurrent.futures.as_completed(future_to_task_name)):
+                future.result()
+                task_name = future_to_task_name[future]
+                print(
+                    f"Downloaded and generated configs for '{task_name}' ({i+1}/{len(task_names)})"
+                )
+        except BaseException:
+            # Stop at the first failure: don't start downloads that are still queued
+            for f in future_to_task_name:
+                f.cancel()
+            raise
+
+
+def download_task_data_and_write_config(task_name, task_data_base_path, task_config_base_path):
+    task_data_path = os.path.join(task_data_base_path, task_name)
+    if task_name in NLP_DOWNLOADER_TASKS:
+        nlp_tasks_download.download_data_and_write_config(
+            task_name=task_name,
+            task_data_path=task_data_path,
+            task_config_path=os.path.join(task_config_base_path, f"{task_name}_config.json"),
+        )
+    elif task_name in XTREME_TASKS:
+        xtreme_download.download_xtreme_data_and_write_config(
+            task_name=task_name,
+            task_data_base_path=task_data_base_path,
+            task_config_base_path=task_config_base_path,
+        )
+    elif task_name in SQUAD_TASKS:
+        files_tasks_download.download_squad_data_and_write_config(
+            task_name=task_name,
+            task_data_path=task_data_path,
+            task_config_path=os.path.join(task_config_base_path, f"{task_name}.json"),
+        )
+    else:
+        raise KeyError()
 
 
 def main():
@@ -75,6 +102,12 @@ def main():
     sp_download_group = sp_download.add_mutually_exclusive_group(required=True)
     sp_download_group.add_argument("--tasks", nargs="+", help="list of tasks to download")
     sp_download_group.add_argument("--benchmark", choices=BENCHMARKS)
+    sp_download.add_argument(
+        "--max_parallel_downloads",
+        type=int,
+        default=1,
+        help="number of tasks to download concurrently",
+    )
 
     # Hook subparsers up to functions
     sp_list.set_defaults(func=list_supported_tasks_cli)
@@ -50,7 +50,7 @@ def get_eval_dataloader_from_cache(
         buffer_size=10000, shuffle=False, subset_num=subset_num, explicit_subset=explicit_subset,
     )
     eval_dataloader = torch_utils.DataLoaderWithLength(
-        dataset=dataset, batch_size=eval_batch_size, collate_fn=task.collate_fn,
+        dataset=dataset, batch_size=eval_batch_size, collate_fn=task.collate_fn, pin_memory=True,
     )
     return eval_dataloader
 
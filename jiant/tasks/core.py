@@ -56,6 +56,18 @@ class BatchMixin(ExtendedDataClassMixin):
         else:
             return v
 
+    def pin_memory(self):
+        # Called by DataLoader(pin_memory=True), which otherwise skips custom batch types
+        # noinspection PyArgumentList
+        return self.__class__(**{k: self._val_pin_memory(v=v) for k, v in self.to_dict().items()})
+
+    @classmethod
+    def _val_pin_memory(cls, v):
+        if isinstance(v, torch.Tensor):
+            return v.pin_memory()
+        else:
+            return v
+
     def __len__(self):
         return len(getattr(self, self.get_fields()[0]))
 
@@ -1,6 +1,7 @@
 import copy
 import math
 import os
+from typing import Iterator
 
 import torch
 import torch.nn as nn
@@ -46,6 +47,23 @@ def copy_state_dict(state_dict, target_device=None):
         return {k: v.to(target_device) for k, v in copied_state_dict.items()}
 
 
+def copy_to_cpu(obj):
+    """Recursively copies an object, moving all tensors in nested dicts/lists/tuples to the CPU"""
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to(CPU_DEVICE, copy=True)
+    elif isinstance(obj, dict):
+        # Preserve the mapping type (e.g. OrderedDict) and state_dict _metadata, which
+        #   load_state_dict uses for versioned modules
+        copied = type(obj)((k, copy_to_cpu(v)) for k, v in obj.items())
+        if hasattr(obj, "_metadata"):
+            copied._metadata = copy.deepcopy(obj._metadata)
+        return copied
+    elif isinstance(obj, (list, tuple)) and not hasattr(obj, "_fields"):
+        return type(obj)(copy_to_cpu(v) for v in obj)
+    else:
+        return copy.deepcopy(obj)
+
+
 def get_parent_child_module_list(model):
     ls = []
     for parent_name, parent_module in model.named_modules():
@@ -115,6 +133,77 @@ class DataLoaderWithLength(DataLoader):
         return math.ceil(len(self.dataset) / self.batch_size)
 
 
+class CudaPrefetchYield(Iterator):
+    """Wraps an InfiniteYield of (batch, batch_metadata), moving each batch to device ahead of time
+
+    On CUDA devices, the host-to-device copy of the next batch is issued on a side stream as soon
+    as the current batch is handed out, so that it overlaps with the forward/backward pass on the
+    default stream. On other devices, batches are simply moved to the device on pop().
+    """
+
+    def __init__(self, infinite_yield, device):
+        self.infinite_yield = infinite_yield
+        self.device = torch.device(device)
+        if self.device.type == "cuda":
+            self.stream = torch.cuda.Stream(device=self.device)
+            self.next_item = self._preload()
+        else:
+            self.stream = None
+            self.next_item = None
+
+    def _preload(self):
+        batch, batch_metadata = self.infinite_yield.pop()
+        # InfiniteYield keeps every batch of the first epoch around, so the dataloader itself does
+        #   not pin memory; instead, pin a transient copy that is released once the copy is done
+        with torch.cuda.stream(self.stream):
+            batch = batch.pin_memory().to(self.device, non_blocking=True)
+        return batch, batch_metadata
+
+    def __next__(self):
+        return self.pop()
+
+    def pop(self):
+        if self.stream is None:
+            batch, batch_metadata = self.infinite_yield.pop()
+            return batch.to(self.device), batch_metadata
+        current_stream = torch.cuda.current_stream(self.device)
+        current_stream.wait_stream(self.stream)
+        batch, batch_metadata = self.next_item
+        for v in batch.to_dict().values():
+            # Memory was allocated on the side stream, but is consumed on the current one
+            if isinstance(v, torch.Tensor):
+                v.record_stream(current_stream)
+        self.next_item = self._preload()
+        return batch, batch_metadata
+
+
+class AsyncToCpu:
+    """Non-blocking device-to-host copy of a tensor; numpy() and item() wait for it to finish"""
+
+    def __init__(self, tensor: torch.Tensor):
+        if tensor.is_cuda:
+            self.cpu_tensor = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self.cpu_tensor.copy_(tensor, non_blocking=True)
+            self.event = torch.cuda.Event()
+            self.event.record()
+        else:
+            self.cpu_tensor = tensor
+            self.event = None
+
+    def numpy(self):
+        if self.event is None:
+            return self.cpu_tensor.numpy()
+        self.event.synchronize()
+        # Callers may hold on to the array (e.g. eval accumulators), so copy it out to pageable
+        #   memory; this lets the pinned block go back to the caching host allocator for reuse
+        return self.cpu_tensor.numpy().copy()
+
+    def item(self):
+        if self.event is not None:
+            self.event.synchronize()
+        return self.cpu_tensor.item()
+
+
 def is_data_parallel(torch_module):
     return isinstance(torch_module, nn.DataParallel)
 
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+import jiant.proj.main.runner as jiant_runner
+import jiant.tasks.evaluate as evaluate
+from jiant.proj.main.components.outputs import LogitsOutput, LogitsAndLossOutput
+from jiant.tasks.lib.mnli import MnliTask
+
+
+class TinyModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.linear = nn.Linear(4, 3)
+        self.tokenizer = None
+
+
+def fake_wrap_jiant_forward(jiant_model, batch, task, compute_loss=False):
+    logits = jiant_model.linear(batch.input_ids.float())
+    if compute_loss:
+        loss = F.cross_entropy(logits, batch.label_id, reduction="none")
+        return LogitsAndLossOutput(logits=logits, loss=loss)
+    else:
+        return LogitsOutput(logits=logits)
+
+
+class RecordingAccumulator(evaluate.ConcatenateLogitsAccumulator):
+    def __init__(self):
+        super().__init__()
+        self.loss_list = []
+
+    def update(self, batch_logits, batch_loss, batch, batch_metadata):
+        super().update(batch_logits, batch_loss, batch, batch_metadata)
+        self.loss_list.append(batch_loss)
+
+
+def get_dataloader(num_batches=3, batch_size=2):
+    rng = np.random.RandomState(0)
+    dataloader = []
+    for i in range(num_batches):
+        batch = MnliTask.Batch(
+            input_ids=torch.tensor(rng.randint(0, 5, size=(batch_size, 4))),
+            input_mask=torch.ones(batch_size, 4, dtype=torch.long),
+            segment_ids=torch.zeros(batch_size, 4, dtype=torch.long),
+            label_id=torch.tensor(rng.randint(0, 3, size=batch_size)),
+            tokens=[["a"] * 4] * batch_size,
+        )
+        dataloader.append((batch, {"guid": [f"val-{i}-{j}" for j in range(batch_size)]}))
+    return dataloader
+
+
+def get_expected_logits_and_losses(model, dataloader, compute_loss):
+    # Reference: the synchronous loop, updating the accumulator right after each forward
+    logits_list, loss_list = [], []
+    with torch.no_grad():
+        for batch, _ in dataloader:
+            model_output = fake_wrap_jiant_forward(
+                jiant_model=model, batch=batch, task=None, compute_loss=compute_loss
+            )
+            logits_list.append(model_output.logits.cpu().numpy())
+            if compute_loss:
+                loss_list.append(model_output.loss.mean().item())
+    return logits_list, loss_list
+
+
+def test_run_val_matches_synchronous_loop(monkeypatch):
+    monkeypatch.setattr(jiant_runner, "wrap_jiant_forward", fake_wrap_jiant_forward)
+    monkeypatch.setattr(
+        evaluate.SimpleAccuracyEvaluationScheme,
+        "get_accumulator",
+        lambda self: RecordingAccumulator(),
+    )
+    model = TinyModel()
+    dataloader = get_dataloader()
+    val_labels = np.concatenate([batch.label_id.numpy() for batch, _ in dataloader])
+    expected_logits, expected_losses = get_expected_logits_and_losses(
+        model=model, dataloader=dataloader, compute_loss=True
+    )
+
+    output = jiant_runner.run_val(
+        val_dataloader=dataloader,
+        val_labels=val_labels,
+        jiant_model=model,
+        task=MnliTask(name="mnli", path_dict={}),
+        device=torch.device("cpu"),
+        local_rank=-1,
+        verbose=False,
+    )
+    accumulator = output["accumulator"]
+    assert len(accumulator.logits_list) == len(dataloader)
+    for logits, expected in zip(accumulator.logits_list, expected_logits):
+        assert np.allclose(logits, expected)
+    assert np.allclose(accumulator.loss_list, expected_losses)
+    assert all(isinstance(loss, float) for loss in accumulator.loss_list)
+    assert np.isclose(output["loss"], np.mean(expected_losses))
+
+
+def test_run_test_matches_synchronous_loop(monkeypatch):
+    monkeypatch.setattr(jiant_runner, "wrap_jiant_forward", fake_wrap_jiant_forward)
+    model = TinyModel()
+    dataloader = get_dataloader()
+    expected_logits, _ = get_expected_logits_and_losses(
+        model=model, dataloader=dataloader, compute_loss=False
+    )
+
+    output = jiant_runner.run_test(
+        test_dataloader=dataloader,
+        jiant_model=model,
+        task=MnliTask(name="mnli", path_dict={}),
+        device=torch.device("cpu"),
+        local_rank=-1,
+        verbose=False,
+    )
+    assert np.allclose(output["accumulator"].get_accumulated(), np.concatenate(expected_logits))
+    assert np.array_equal(output["preds"], np.argmax(np.concatenate(expected_logits), axis=1))
+
+
+def test_checkpoint_saver_save_and_wait(tmpdir):
+    model = TinyModel()
+    save_path = str(tmpdir.join("checkpoint.p"))
+    checkpoint_saver = jiant_runner.CheckpointSaver(metadata={"a": 1}, save_path=save_path)
+    checkpoint_saver.save(
+        runner_state={"model": model.state_dict()},
+        metarunner_state={"best_state_dict": None, "train_state": {"global_steps": 3}},
+    )
+    # Updates after save() returns must not leak into the checkpoint
+    expected_weight = model.linear.weight.detach().clone()
+    with torch.no_grad():
+        model.linear.weight.add_(1)
+    checkpoint_saver.wait()
+
+    loaded = torch.load(save_path)
+    assert torch.equal(loaded["runner_state"]["model"]["linear.weight"], expected_weight)
+    assert loaded["metarunner_state"]["train_state"] == {"global_steps": 3}
+    assert loaded["metadata"] == {"a": 1}
+
+
+def test_checkpoint_saver_wait_surfaces_write_errors(monkeypatch, tmpdir):
+    def failing_safe_save(obj, path):
+        raise IOError("disk full")
+
+    monkeypatch.setattr(jiant_runner.torch_utils, "safe_save", failing_safe_save)
+    checkpoint_saver = jiant_runner.CheckpointSaver(
+        metadata={}, save_path=str(tmpdir.join("checkpoint.p"))
+    )
+    checkpoint_saver.save(runner_state={}, metarunner_state={})
+    with pytest.raises(IOError, match="disk full"):
+        checkpoint_saver.wait()
+    # The error is only raised once
+    checkpoint_saver.wait()
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+import jiant.scripts.download_data.runscript as download_runscript
+
+
+def test_download_data_prints_progress_for_every_task(monkeypatch, tmpdir, capsys):
+    downloaded = []
+
+    def fake_download_task_data_and_write_config(
+        task_name, task_data_base_path, task_config_base_path
+    ):
+        downloaded.append(task_name)
+
+    monkeypatch.setattr(
+        download_runscript,
+        "download_task_data_and_write_config",
+        fake_download_task_data_and_write_config,
+    )
+    task_names = ["rte", "mrpc", "cola"]
+    download_runscript.download_data(
+        task_names=task_names, output_base_path=str(tmpdir), max_parallel_downloads=2
+    )
+
+    assert sorted(downloaded) == sorted(task_names)
+    progress_lines = capsys.readouterr().out.strip().splitlines()
+    assert len(progress_lines) == len(task_names)
+    for task_name in task_names:
+        assert sum(f"'{task_name}'" in line for line in progress_lines) == 1
+    for i, line in enumerate(progress_lines):
+        assert line.endswith(f"({i + 1}/{len(task_names)})")
+
+
+def test_download_data_failure_cancels_queued_tasks(monkeypatch, tmpdir, capsys):
+    downloaded = []
+
+    def fake_download_task_data_and_write_config(
+        task_name, task_data_base_path, task_config_base_path
+    ):
+        downloaded.append(task_name)
+        if task_name == "rte":
+            raise RuntimeError("download failed")
+        # Give the main thread time to cancel whatever is still queued
+        time.sleep(0.2)
+
+    monkeypatch.setattr(
+        download_runscript,
+        "download_task_data_and_write_config",
+        fake_download_task_data_and_write_config,
+    )
+    with pytest.raises(RuntimeError, match="download failed"):
+        download_runscript.download_data(
+            task_names=["rte", "mrpc", "cola", "sst"],
+            output_base_path=str(tmpdir),
+            max_parallel_downloads=1,
+        )
+
+    # With a single worker, at most the task picked up right after the failure can have started
+    assert downloaded[0] == "rte"
+    assert downloaded in (["rte"], ["rte", "mrpc"])
+    assert "Downloaded and generated configs" not in capsys.readouterr().out
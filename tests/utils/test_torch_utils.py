@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+import torch
+import torch.nn as nn
+
+import jiant.utils.torch_utils as torch_utils
+
+
+def test_copy_to_cpu_state_dict_round_trip():
+    model = nn.Sequential(nn.Linear(3, 2), nn.BatchNorm1d(2))
+    state_dict = model.state_dict()
+    copied = torch_utils.copy_to_cpu(state_dict)
+
+    assert isinstance(copied, OrderedDict)
+    assert list(copied.keys()) == list(state_dict.keys())
+    assert copied._metadata == state_dict._metadata
+    for k, v in state_dict.items():
+        assert torch.equal(copied[k], v)
+        assert copied[k].data_ptr() != v.data_ptr()
+
+    new_model = nn.Sequential(nn.Linear(3, 2), nn.BatchNorm1d(2))
+    new_model.load_state_dict(copied)
+    for k, v in new_model.state_dict().items():
+        assert torch.equal(v, state_dict[k])
+
+
+def test_copy_to_cpu_is_a_snapshot():
+    tensor = torch.zeros(3)
+    copied = torch_utils.copy_to_cpu({"a": [tensor, (tensor, 1)], "b": "x"})
+    tensor += 1
+    assert torch.equal(copied["a"][0], torch.zeros(3))
+    assert isinstance(copied["a"][1], tuple)
+    assert torch.equal(copied["a"][1][0], torch.zeros(3))
+    assert copied["a"][1][1] == 1
+    assert copied["b"] == "x"